@@ -5,13 +5,17 @@ Serves the SPA frontend and provides JSON API endpoints.
 """
 import os
 import sys
-import json
+import gzip
+import hashlib
+
+import orjson
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from flask import Flask, render_template, jsonify
+from flask import Flask, Response, render_template, request
 from src.analytics import (
-    get_full_dashboard_data, get_kpi_summary,
+    get_data_version, get_full_dashboard_data, iter_dashboard_panels,
+    read_dashboard_payload, get_kpi_summary,
     get_revenue_trend, get_deals_by_stage, get_deals_by_region,
     get_deals_by_industry, get_deals_by_pipeline,
     get_marketing_channels, get_marketing_trend, get_marketing_event_types,
@@ -30,6 +34,55 @@ app = Flask(
 )
 
 
+# ── Response cache ─────────────────────────────────────────────────
+
+# Serialized responses keyed by provider name:
+# (data_version, body, gzipped body, etag).
+_response_cache: dict[str, tuple[float, bytes, bytes, str]] = {}
+
+
+def _cache_entry(provider, precomputed=None) -> tuple[float, bytes, bytes, str]:
+    version = get_data_version()
+    entry = _response_cache.get(provider.__name__)
+    if entry is None or entry[0] != version:
+        body = precomputed() if precomputed is not None else None
+        if body is None:
+            body = orjson.dumps(provider(), option=orjson.OPT_SERIALIZE_NUMPY)
+        body_gz = gzip.compress(body, compresslevel=6)
+        etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+        entry = _response_cache[provider.__name__] = (version, body, body_gz, etag)
+    return entry
+
+
+def _cached_json(provider, precomputed=None) -> Response:
+    """Serve a provider's payload from cache, answering 304 on ETag match.
+
+    ``precomputed`` may return ready-made JSON bytes for the provider, or
+    None to fall back to building the payload.
+    """
+    version, body, body_gz, etag = _cache_entry(provider, precomputed)
+    if request.accept_encodings.quality("gzip") > 0:
+        resp = Response(body_gz, mimetype="application/json")
+        resp.headers["Content-Encoding"] = "gzip"
+        etag += "-gz"
+    else:
+        resp = Response(body, mimetype="application/json")
+    resp.vary.add("Accept-Encoding")
+    # Let browsers keep the body but revalidate on every load; unchanged
+    # data costs a 304 instead of a full download.
+    resp.cache_control.public = True
+    resp.cache_control.no_cache = True
+    if version:
+        resp.last_modified = version
+    resp.set_etag(etag)
+    return resp.make_conditional(request)
+
+
+def warm_cache():
+    """Build the full dashboard payload ahead of the first request."""
+    _cache_entry(get_full_dashboard_data, read_dashboard_payload)
+
+
 # ── Pages ──────────────────────────────────────────────────────────
 
 @app.route("/")
@@ -41,118 +94,128 @@ def index():
 
 @app.route("/api/dashboard")
 def api_dashboard():
-    return jsonify(get_full_dashboard_data())
+    return _cached_json(get_full_dashboard_data, read_dashboard_payload)
+
+
+@app.route("/api/dashboard/stream")
+def api_dashboard_stream():
+    """NDJSON: one ``{"<panel>": {...}}`` line per chart as soon as it is built."""
+    def generate():
+        for key, panel in iter_dashboard_panels():
+            yield orjson.dumps({key: panel}, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n"
+    return Response(generate(), mimetype="application/x-ndjson")
 
 
 @app.route("/api/kpis")
 def api_kpis():
-    return jsonify(get_kpi_summary())
+    return _cached_json(get_kpi_summary)
 
 
 @app.route("/api/revenue-trend")
 def api_revenue_trend():
-    return jsonify(get_revenue_trend())
+    return _cached_json(get_revenue_trend)
 
 
 @app.route("/api/deals/stages")
 def api_deals_stages():
-    return jsonify(get_deals_by_stage())
+    return _cached_json(get_deals_by_stage)
 
 
 @app.route("/api/deals/region")
 def api_deals_region():
-    return jsonify(get_deals_by_region())
+    return _cached_json(get_deals_by_region)
 
 
 @app.route("/api/deals/industry")
 def api_deals_industry():
-    return jsonify(get_deals_by_industry())
+    return _cached_json(get_deals_by_industry)
 
 
 @app.route("/api/deals/pipeline")
 def api_deals_pipeline():
-    return jsonify(get_deals_by_pipeline())
+    return _cached_json(get_deals_by_pipeline)
 
 
 @app.route("/api/marketing/channels")
 def api_marketing_channels():
-    return jsonify(get_marketing_channels())
+    return _cached_json(get_marketing_channels)
 
 
 @app.route("/api/marketing/trend")
 def api_marketing_trend():
-    return jsonify(get_marketing_trend())
+    return _cached_json(get_marketing_trend)
 
 
 @app.route("/api/marketing/events")
 def api_marketing_events():
-    return jsonify(get_marketing_event_types())
+    return _cached_json(get_marketing_event_types)
 
 
 @app.route("/api/email/performance")
 def api_email_performance():
-    return jsonify(get_email_performance())
+    return _cached_json(get_email_performance)
 
 
 @app.route("/api/email/trend")
 def api_email_trend():
-    return jsonify(get_email_trend())
+    return _cached_json(get_email_trend)
 
 
 @app.route("/api/email/by-hour")
 def api_email_by_hour():
-    return jsonify(get_email_by_hour())
+    return _cached_json(get_email_by_hour)
 
 
 @app.route("/api/contacts/lifecycle")
 def api_contacts_lifecycle():
-    return jsonify(get_contacts_lifecycle())
+    return _cached_json(get_contacts_lifecycle)
 
 
 @app.route("/api/contacts/source")
 def api_contacts_source():
-    return jsonify(get_contacts_by_source())
+    return _cached_json(get_contacts_by_source)
 
 
 @app.route("/api/support/category")
 def api_support_category():
-    return jsonify(get_support_by_category())
+    return _cached_json(get_support_by_category)
 
 
 @app.route("/api/support/priority")
 def api_support_priority():
-    return jsonify(get_support_by_priority())
+    return _cached_json(get_support_by_priority)
 
 
 @app.route("/api/web/pages")
 def api_web_pages():
-    return jsonify(get_web_top_pages())
+    return _cached_json(get_web_top_pages)
 
 
 @app.route("/api/web/country")
 def api_web_country():
-    return jsonify(get_web_by_country())
+    return _cached_json(get_web_by_country)
 
 
 @app.route("/api/web/device")
 def api_web_device():
-    return jsonify(get_web_by_device())
+    return _cached_json(get_web_by_device)
 
 
 @app.route("/api/web/trend")
 def api_web_trend():
-    return jsonify(get_web_trend())
+    return _cached_json(get_web_trend)
 
 
 @app.route("/api/companies/industry")
 def api_companies_industry():
-    return jsonify(get_companies_by_industry())
+    return _cached_json(get_companies_by_industry)
 
 
 @app.route("/api/companies/region")
 def api_companies_region():
-    return jsonify(get_companies_by_region())
+    return _cached_json(get_companies_by_region)
 
 
 if __name__ == "__main__":
-    app.run(host=DASHBOARD_HOST, port=DASHBOARD_PORT, debug=DEBUG)
+    warm_cache()
+    app.run(host=DASHBOARD_HOST, port=DASHBOARD_PORT, debug=DEBUG, threaded=True)
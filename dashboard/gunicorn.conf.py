@@ -0,0 +1,31 @@
+"""
+Gunicorn settings for serving the dashboard outside of debug mode.
+
+Usage:
+    gunicorn -c dashboard/gunicorn.conf.py dashboard.app:app
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from src.config import (
+    BASE_DIR, DASHBOARD_HOST, DASHBOARD_PORT,
+    DASHBOARD_WORKERS, DASHBOARD_THREADS,
+)
+
+chdir = BASE_DIR
+bind = f"{DASHBOARD_HOST}:{DASHBOARD_PORT}"
+workers = DASHBOARD_WORKERS
+worker_class = "gthread"
+threads = DASHBOARD_THREADS
+# Hold idle connections long enough for a page load's HTML, static assets
+# and /api/dashboard to share one socket.
+keepalive = 5
+preload_app = True
+
+
+def when_ready(server):
+    # Runs in the master after the app is preloaded and before workers fork,
+    # so every worker inherits the already-built dashboard payload.
+    from dashboard.app import warm_cache
+    warm_cache()
@@ -0,0 +1,35 @@
+"""
+Display labels for generated entities.
+
+Names and emails are pure functions of the entity id, so they are not stored
+in the raw Parquet files; derive them here only where a label is rendered.
+"""
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+EMAIL_DOMAINS = ["gmail.com", "yahoo.com", "outlook.com", "company.io", "business.com",
+                 "tech.org", "work.net", "mail.com", "proton.me", "fastmail.com"]
+
+
+def _format_ids(prefix: str, ids: np.ndarray, width: int = 0, suffix: pa.Array | None = None) -> np.ndarray:
+    """Vectorized ``f"{prefix}{id:0{width}d}{suffix}"`` using Arrow string kernels."""
+    text = pc.cast(pa.array(ids), pa.string())
+    if width:
+        text = pc.utf8_lpad(text, width, "0")
+    parts = [prefix, text] if suffix is None else [prefix, text, suffix]
+    return pc.binary_join_element_wise(*parts, "").to_numpy(zero_copy_only=False)
+
+
+def company_names(ids: np.ndarray) -> np.ndarray:
+    return _format_ids("Company_", np.asarray(ids), width=6)
+
+
+def deal_names(ids: np.ndarray) -> np.ndarray:
+    return _format_ids("Deal_", np.asarray(ids), width=7)
+
+
+def contact_emails(ids: np.ndarray) -> np.ndarray:
+    ids = np.asarray(ids)
+    at_domains = pa.array([f"@{d}" for d in EMAIL_DOMAINS]).take(pa.array(ids % len(EMAIL_DOMAINS)))
+    return _format_ids("user_", ids, suffix=at_domains)
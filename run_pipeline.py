@@ -7,8 +7,13 @@ Usage:
     python run_pipeline.py --generate   # Only generate data
     python run_pipeline.py --etl        # Only run ETL
     python run_pipeline.py --dashboard  # Only launch dashboard
+
+The dashboard is served by gunicorn (gthread workers) when it is installed,
+falling back to Flask's threaded development server with FLASK_DEBUG=1.
 """
+import os
 import sys
+import shutil
 import argparse
 
 
@@ -30,10 +35,19 @@ def main():
         run_etl()
 
     if run_all or args.dashboard:
-        from dashboard.app import app
-        from src.config import DASHBOARD_HOST, DASHBOARD_PORT, DEBUG
+        from src.config import BASE_DIR, DASHBOARD_HOST, DASHBOARD_PORT, DEBUG
         print(f"\n🌐 Dashboard: http://localhost:{DASHBOARD_PORT}")
-        app.run(host=DASHBOARD_HOST, port=DASHBOARD_PORT, debug=DEBUG)
+        gunicorn = shutil.which("gunicorn")
+        if gunicorn and not DEBUG:
+            conf = os.path.join(BASE_DIR, "dashboard", "gunicorn.conf.py")
+            # execv discards unflushed buffers, which hold everything printed
+            # so far when stdout is a pipe or file.
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.execv(gunicorn, [gunicorn, "-c", conf, "dashboard.app:app"])
+        from dashboard.app import app, warm_cache
+        warm_cache()
+        app.run(host=DASHBOARD_HOST, port=DASHBOARD_PORT, debug=DEBUG, threaded=True)
 
 
 if __name__ == "__main__":
@@ -5,378 +5,591 @@ JSON-serialisable summaries consumed by the dashboard API.
 """
 import os
 import json
-import numpy as np
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, wraps
 
-from src.config import AGGREGATED_DIR, PROCESSED_DIR
+import numpy as np
+import orjson
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from src.config import (
+    AGGREGATED_DIR, PROCESSED_DIR, NUM_PARTITIONS,
+    DEAL_STAGES, LIFECYCLE_STAGES, TICKET_PRIORITIES,
+)
+
+# Display order of the categorical chart axes.
+_STAGE_ORDER = pa.array(DEAL_STAGES)
+_LIFECYCLE_ORDER = pa.array(LIFECYCLE_STAGES)
+_PRIORITY_ORDER = pa.array(TICKET_PRIORITIES)
+
+
+@lru_cache(maxsize=64)
+def _read_table(path: str, mtime_ns: int, columns: tuple[str, ...] | None) -> pa.Table:
+    # mtime_ns is only part of the cache key: a rewritten file misses the cache.
+    # Not memory-mapped: cached tables outlive the file, which the ETL
+    # rewrites in place.
+    return pq.read_table(path, columns=None if columns is None else list(columns),
+                         pre_buffer=True, use_threads=True)
+
+
+def _load(name: str, directory: str | None = None,
+          columns: list[str] | None = None) -> pa.Table | None:
+    """Read an ETL output as an Arrow table, memoized until the file changes
+    on disk. Tables are immutable, so sharing the cached one is safe.
+
+    ``directory`` defaults to AGGREGATED_DIR as configured at call time.
+    """
+    path = os.path.join(directory or AGGREGATED_DIR, f"{name}.parquet")
+    mtime_ns = _mtime_ns(path)
+    if mtime_ns is None:
+        return None
+    return _read_table(path, mtime_ns, None if columns is None else tuple(columns))
 
 
-def _load(name: str, directory: str = AGGREGATED_DIR) -> pd.DataFrame | None:
-    path = os.path.join(directory, f"{name}.parquet")
-    if not os.path.exists(path):
+def _mtime_ns(path: str) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
         return None
-    return pd.read_parquet(path)
 
 
-def _fmt(val, precision=2):
-    if isinstance(val, (np.floating, float)):
-        return round(float(val), precision)
-    if isinstance(val, (np.integer, int)):
-        return int(val)
-    return val
+# Providers wrapped by _memoize_on, so clear_cache can reach them.
+_memoized_providers = []
+
+
+def _memoize_on(*names: str, processed: bool = False):
+    """Cache a provider's result until one of its source files changes.
+
+    The files are looked up in AGGREGATED_DIR, or PROCESSED_DIR if
+    ``processed``, resolved on every call rather than at import.
+    """
+    def decorator(provider):
+        cached = None
+
+        @wraps(provider)
+        def wrapper():
+            nonlocal cached
+            directory = PROCESSED_DIR if processed else AGGREGATED_DIR
+            key = tuple(_mtime_ns(os.path.join(directory, f"{n}.parquet")) for n in names)
+            if cached is not None and cached[0] == key:
+                return cached[1]
+            value = provider()
+            cached = (key, value)
+            return value
+
+        def cache_clear():
+            nonlocal cached
+            cached = None
+
+        wrapper.cache_clear = cache_clear
+        _memoized_providers.append(wrapper)
+        return wrapper
+    return decorator
+
+
+def get_data_version() -> float:
+    """Latest modification time across the ETL outputs read by this module.
+
+    Changes whenever the pipeline rewrites a processed or aggregated file,
+    so callers can use it to invalidate anything derived from that data.
+    """
+    version = 0.0
+    for directory in (PROCESSED_DIR, AGGREGATED_DIR):
+        if not os.path.isdir(directory):
+            continue
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".parquet"):
+                    version = max(version, entry.stat().st_mtime)
+    return version
+
+
+def _fmt_float(val, precision: int = 2) -> float:
+    """Round a numeric value to a native float for JSON output."""
+    return round(float(val), precision)
+
+
+def _fmt_col(col: pa.ChunkedArray, precision: int = 2, scale: float = 1) -> list[float]:
+    """``[_fmt_float(v * scale, precision) for v in col]`` for a numeric column.
+
+    Scaling and the conversion to native floats happen in one numpy pass;
+    only the correctly-rounded builtin ``round`` runs per element.
+    """
+    values = col.to_numpy().astype(np.float64, copy=False) * scale
+    return [round(v, precision) for v in values.tolist()]
+
+
+def _int_col(col: pa.ChunkedArray) -> list[int]:
+    return col.to_numpy().astype(np.int64, copy=False).tolist()
+
+
+def _sort_by_order(tbl: pa.Table, column: str, order: pa.Array) -> pa.Table:
+    """Rows of ``tbl`` in the position of ``column`` within ``order``;
+    labels missing from ``order`` go last."""
+    rank = pc.fill_null(pc.index_in(tbl[column], value_set=order), len(order))
+    return tbl.take(pc.sort_indices(rank))
 
 
 # ── KPI Summary ─────────────────────────────────────────────────────
 
+@_memoize_on("deals", "contacts", "companies", "web_analytics", "support_tickets",
+             "email_campaigns", processed=True)
 def get_kpi_summary() -> dict:
-    """Top-level KPIs for the dashboard header."""
-    deals = _load("deals", PROCESSED_DIR)
-    contacts = _load("contacts", PROCESSED_DIR)
-    companies = _load("companies", PROCESSED_DIR)
-    web = _load("web_analytics", PROCESSED_DIR)
-    tickets = _load("support_tickets", PROCESSED_DIR)
-    emails = _load("email_campaigns", PROCESSED_DIR)
-
-    total_revenue = float(deals["amount"].sum()) if deals is not None else 0
-    won_revenue = float(deals.loc[deals["is_won"] == 1, "amount"].sum()) if deals is not None else 0
-    pipeline_value = float(deals["weighted_amount"].sum()) if deals is not None else 0
-    win_rate = float(deals["is_won"].mean()) if deals is not None else 0
-    avg_deal = float(deals["amount"].mean()) if deals is not None else 0
-
-    total_contacts = len(contacts) if contacts is not None else 0
-    total_companies = len(companies) if companies is not None else 0
-    total_deals = len(deals) if deals is not None else 0
-
-    conversion_rate = float(web["conversion"].mean()) if web is not None else 0
-    bounce_rate = float(web["bounce"].mean()) if web is not None else 0
-    total_sessions = len(web) if web is not None else 0
-
-    avg_csat = float(tickets["satisfaction_score"].mean()) if tickets is not None else 0
-    sla_rate = float(tickets["sla_met"].mean()) if tickets is not None else 0
-    total_tickets = len(tickets) if tickets is not None else 0
-
-    email_open_rate = float(emails["is_opened"].mean()) if emails is not None else 0
-    email_click_rate = float(emails["is_clicked"].mean()) if emails is not None else 0
+    """Top-level KPIs for the dashboard header.
+
+    Reduced directly on the projected Arrow columns of the processed
+    tables; row counts come from an empty projection.
+    """
+    deals = _load("deals", PROCESSED_DIR, ["amount", "is_won", "weighted_amount"])
+    contacts = _load("contacts", PROCESSED_DIR, [])
+    companies = _load("companies", PROCESSED_DIR, [])
+    web = _load("web_analytics", PROCESSED_DIR, ["conversion", "bounce"])
+    tickets = _load("support_tickets", PROCESSED_DIR, ["satisfaction_score", "sla_met"])
+    emails = _load("email_campaigns", PROCESSED_DIR, ["is_opened", "is_clicked"])
+
+    if deals is not None:
+        # One reduction per column; the means are derived from the sums and
+        # non-null counts, so nulls are skipped as in pc.mean.
+        amount = deals["amount"]
+        won = pc.equal(deals["is_won"], 1)
+        total_revenue = pc.sum(amount, min_count=0).as_py()
+        won_revenue = pc.sum(pc.filter(amount, won), min_count=0).as_py()
+        pipeline_value = pc.sum(deals["weighted_amount"], min_count=0).as_py()
+        win_rate = pc.sum(won, min_count=0).as_py() / max(pc.count(won).as_py(), 1)
+        avg_deal = total_revenue / max(pc.count(amount).as_py(), 1)
+    else:
+        total_revenue = won_revenue = pipeline_value = win_rate = avg_deal = 0
+
+    total_contacts = contacts.num_rows if contacts is not None else 0
+    total_companies = companies.num_rows if companies is not None else 0
+    total_deals = deals.num_rows if deals is not None else 0
+
+    conversion_rate = pc.mean(web["conversion"]).as_py() if web is not None and web.num_rows else 0
+    bounce_rate = pc.mean(web["bounce"]).as_py() if web is not None and web.num_rows else 0
+    total_sessions = web.num_rows if web is not None else 0
+
+    avg_csat = (pc.mean(tickets["satisfaction_score"]).as_py()
+                if tickets is not None and tickets.num_rows else 0)
+    sla_rate = pc.mean(tickets["sla_met"]).as_py() if tickets is not None and tickets.num_rows else 0
+    total_tickets = tickets.num_rows if tickets is not None else 0
+
+    email_open_rate = (pc.mean(emails["is_opened"]).as_py()
+                       if emails is not None and emails.num_rows else 0)
+    email_click_rate = (pc.mean(emails["is_clicked"]).as_py()
+                        if emails is not None and emails.num_rows else 0)
 
     return {
-        "total_revenue": _fmt(total_revenue),
-        "won_revenue": _fmt(won_revenue),
-        "pipeline_value": _fmt(pipeline_value),
-        "win_rate": _fmt(win_rate * 100, 1),
-        "avg_deal_size": _fmt(avg_deal),
+        "total_revenue": _fmt_float(total_revenue),
+        "won_revenue": _fmt_float(won_revenue),
+        "pipeline_value": _fmt_float(pipeline_value),
+        "win_rate": _fmt_float(win_rate * 100, 1),
+        "avg_deal_size": _fmt_float(avg_deal),
         "total_contacts": total_contacts,
         "total_companies": total_companies,
         "total_deals": total_deals,
-        "conversion_rate": _fmt(conversion_rate * 100, 2),
-        "bounce_rate": _fmt(bounce_rate * 100, 1),
+        "conversion_rate": _fmt_float(conversion_rate * 100, 2),
+        "bounce_rate": _fmt_float(bounce_rate * 100, 1),
         "total_sessions": total_sessions,
-        "avg_csat": _fmt(avg_csat, 1),
-        "sla_compliance": _fmt(sla_rate * 100, 1),
+        "avg_csat": _fmt_float(avg_csat, 1),
+        "sla_compliance": _fmt_float(sla_rate * 100, 1),
         "total_tickets": total_tickets,
-        "email_open_rate": _fmt(email_open_rate * 100, 1),
-        "email_click_rate": _fmt(email_click_rate * 100, 1),
+        "email_open_rate": _fmt_float(email_open_rate * 100, 1),
+        "email_click_rate": _fmt_float(email_click_rate * 100, 1),
     }
 
 
 # ── Chart Data Providers ───────────────────────────────────────────
 
+@_memoize_on("revenue_by_month")
 def get_revenue_trend() -> dict:
-    df = _load("revenue_by_month")
-    if df is None:
+    tbl = _load("revenue_by_month", columns=["month", "total_revenue", "weighted_pipeline"])
+    if tbl is None:
         return {"labels": [], "datasets": []}
-    df = df.sort_values("month")
+    tbl = tbl.sort_by("month")
     return {
-        "labels": df["month"].tolist(),
+        "labels": tbl["month"].to_pylist(),
         "datasets": [
-            {"label": "Closed Revenue", "data": [_fmt(v) for v in df["total_revenue"]]},
-            {"label": "Weighted Pipeline", "data": [_fmt(v) for v in df["weighted_pipeline"]]},
+            {"label": "Closed Revenue", "data": _fmt_col(tbl["total_revenue"])},
+            {"label": "Weighted Pipeline", "data": _fmt_col(tbl["weighted_pipeline"])},
         ]
     }
 
 
+@_memoize_on("pipeline_stages")
 def get_deals_by_stage() -> dict:
-    df = _load("pipeline_stages")
-    if df is None:
+    tbl = _load("pipeline_stages", columns=["stage", "count", "total_value"])
+    if tbl is None:
         return {"labels": [], "data": []}
-    stage_order = ["Prospecting", "Qualification", "Proposal", "Negotiation", "Closed Won", "Closed Lost"]
-    df["_order"] = df["stage"].map({s: i for i, s in enumerate(stage_order)})
-    df = df.sort_values("_order")
+    tbl = _sort_by_order(tbl, "stage", _STAGE_ORDER)
     return {
-        "labels": df["stage"].tolist(),
-        "counts": [int(v) for v in df["count"]],
-        "values": [_fmt(v) for v in df["total_value"]],
+        "labels": tbl["stage"].to_pylist(),
+        "counts": _int_col(tbl["count"]),
+        "values": _fmt_col(tbl["total_value"]),
     }
 
 
+@_memoize_on("deals_by_region")
 def get_deals_by_region() -> dict:
-    df = _load("deals_by_region")
-    if df is None:
+    tbl = _load("deals_by_region", columns=["region", "total_revenue", "win_rate", "deal_count"])
+    if tbl is None:
         return {"labels": [], "data": []}
-    df = df.sort_values("total_revenue", ascending=False)
+    tbl = tbl.sort_by([("total_revenue", "descending")])
     return {
-        "labels": df["region"].tolist(),
-        "revenue": [_fmt(v) for v in df["total_revenue"]],
-        "win_rate": [_fmt(v * 100, 1) for v in df["win_rate"]],
-        "deal_count": [int(v) for v in df["deal_count"]],
+        "labels": tbl["region"].to_pylist(),
+        "revenue": _fmt_col(tbl["total_revenue"]),
+        "win_rate": _fmt_col(tbl["win_rate"], 1, scale=100),
+        "deal_count": _int_col(tbl["deal_count"]),
     }
 
 
+@_memoize_on("deals_by_industry")
 def get_deals_by_industry() -> dict:
-    df = _load("deals_by_industry")
-    if df is None:
+    tbl = _load("deals_by_industry", columns=["industry", "total_revenue", "win_rate", "deal_count"])
+    if tbl is None:
         return {"labels": [], "data": []}
-    df = df.sort_values("total_revenue", ascending=False)
+    tbl = tbl.sort_by([("total_revenue", "descending")])
     return {
-        "labels": df["industry"].tolist(),
-        "revenue": [_fmt(v) for v in df["total_revenue"]],
-        "win_rate": [_fmt(v * 100, 1) for v in df["win_rate"]],
-        "deal_count": [int(v) for v in df["deal_count"]],
+        "labels": tbl["industry"].to_pylist(),
+        "revenue": _fmt_col(tbl["total_revenue"]),
+        "win_rate": _fmt_col(tbl["win_rate"], 1, scale=100),
+        "deal_count": _int_col(tbl["deal_count"]),
     }
 
 
+@_memoize_on("deals_by_pipeline")
 def get_deals_by_pipeline() -> dict:
-    df = _load("deals_by_pipeline")
-    if df is None:
+    tbl = _load("deals_by_pipeline", columns=["pipeline", "total_revenue", "win_rate", "deal_count"])
+    if tbl is None:
         return {"labels": [], "data": []}
     return {
-        "labels": df["pipeline"].tolist(),
-        "revenue": [_fmt(v) for v in df["total_revenue"]],
-        "win_rate": [_fmt(v * 100, 1) for v in df["win_rate"]],
-        "deal_count": [int(v) for v in df["deal_count"]],
+        "labels": tbl["pipeline"].to_pylist(),
+        "revenue": _fmt_col(tbl["total_revenue"]),
+        "win_rate": _fmt_col(tbl["win_rate"], 1, scale=100),
+        "deal_count": _int_col(tbl["deal_count"]),
     }
 
 
+@_memoize_on("marketing_by_channel")
 def get_marketing_channels() -> dict:
-    df = _load("marketing_by_channel")
-    if df is None:
+    tbl = _load("marketing_by_channel", columns=[
+        "channel", "event_count", "engagement_rate", "avg_session_duration",
+    ])
+    if tbl is None:
         return {"labels": [], "data": []}
-    df = df.sort_values("event_count", ascending=False)
+    tbl = tbl.sort_by([("event_count", "descending")])
     return {
-        "labels": df["channel"].tolist(),
-        "event_count": [int(v) for v in df["event_count"]],
-        "engagement_rate": [_fmt(v * 100, 1) for v in df["engagement_rate"]],
-        "avg_duration": [_fmt(v, 0) for v in df["avg_session_duration"]],
+        "labels": tbl["channel"].to_pylist(),
+        "event_count": _int_col(tbl["event_count"]),
+        "engagement_rate": _fmt_col(tbl["engagement_rate"], 1, scale=100),
+        "avg_duration": _fmt_col(tbl["avg_session_duration"], 0),
     }
 
 
+@_memoize_on("marketing_by_month")
 def get_marketing_trend() -> dict:
-    df = _load("marketing_by_month")
-    if df is None:
+    tbl = _load("marketing_by_month", columns=["month", "event_count", "engagement_rate"])
+    if tbl is None:
         return {"labels": [], "datasets": []}
-    df = df.sort_values("month")
+    tbl = tbl.sort_by("month")
     return {
-        "labels": df["month"].tolist(),
+        "labels": tbl["month"].to_pylist(),
         "datasets": [
-            {"label": "Events", "data": [int(v) for v in df["event_count"]]},
-            {"label": "Engagement %", "data": [_fmt(v * 100, 1) for v in df["engagement_rate"]]},
+            {"label": "Events", "data": _int_col(tbl["event_count"])},
+            {"label": "Engagement %", "data": _fmt_col(tbl["engagement_rate"], 1, scale=100)},
         ]
     }
 
 
+@_memoize_on("marketing_by_event_type")
 def get_marketing_event_types() -> dict:
-    df = _load("marketing_by_event_type")
-    if df is None:
+    tbl = _load("marketing_by_event_type", columns=["event_type", "event_count", "engagement_rate"])
+    if tbl is None:
         return {"labels": [], "data": []}
-    df = df.sort_values("event_count", ascending=False)
+    tbl = tbl.sort_by([("event_count", "descending")])
     return {
-        "labels": df["event_type"].tolist(),
-        "event_count": [int(v) for v in df["event_count"]],
-        "engagement_rate": [_fmt(v * 100, 1) for v in df["engagement_rate"]],
+        "labels": tbl["event_type"].to_pylist(),
+        "event_count": _int_col(tbl["event_count"]),
+        "engagement_rate": _fmt_col(tbl["engagement_rate"], 1, scale=100),
     }
 
 
+@_memoize_on("email_performance")
 def get_email_performance() -> dict:
-    df = _load("email_performance")
-    if df is None:
+    tbl = _load("email_performance", columns=[
+        "campaign_type", "open_rate", "click_rate", "bounce_rate", "unsub_rate",
+    ])
+    if tbl is None:
         return {"labels": [], "data": []}
     return {
-        "labels": df["campaign_type"].tolist(),
-        "open_rate": [_fmt(v * 100, 1) for v in df["open_rate"]],
-        "click_rate": [_fmt(v * 100, 1) for v in df["click_rate"]],
-        "bounce_rate": [_fmt(v * 100, 1) for v in df["bounce_rate"]],
-        "unsub_rate": [_fmt(v * 100, 2) for v in df["unsub_rate"]],
+        "labels": tbl["campaign_type"].to_pylist(),
+        "open_rate": _fmt_col(tbl["open_rate"], 1, scale=100),
+        "click_rate": _fmt_col(tbl["click_rate"], 1, scale=100),
+        "bounce_rate": _fmt_col(tbl["bounce_rate"], 1, scale=100),
+        "unsub_rate": _fmt_col(tbl["unsub_rate"], 2, scale=100),
     }
 
 
+@_memoize_on("email_by_month")
 def get_email_trend() -> dict:
-    df = _load("email_by_month")
-    if df is None:
+    tbl = _load("email_by_month", columns=["month", "open_rate", "click_rate"])
+    if tbl is None:
         return {"labels": [], "datasets": []}
-    df = df.sort_values("month")
+    tbl = tbl.sort_by("month")
     return {
-        "labels": df["month"].tolist(),
+        "labels": tbl["month"].to_pylist(),
         "datasets": [
-            {"label": "Open Rate %", "data": [_fmt(v * 100, 1) for v in df["open_rate"]]},
-            {"label": "Click Rate %", "data": [_fmt(v * 100, 1) for v in df["click_rate"]]},
+            {"label": "Open Rate %", "data": _fmt_col(tbl["open_rate"], 1, scale=100)},
+            {"label": "Click Rate %", "data": _fmt_col(tbl["click_rate"], 1, scale=100)},
         ]
     }
 
 
+@_memoize_on("email_by_hour")
 def get_email_by_hour() -> dict:
-    df = _load("email_by_hour")
-    if df is None:
+    tbl = _load("email_by_hour", columns=["send_hour", "open_rate", "click_rate"])
+    if tbl is None:
         return {"labels": [], "data": []}
-    df = df.sort_values("send_hour")
+    tbl = tbl.sort_by("send_hour")
     return {
-        "labels": [f"{h:02d}:00" for h in df["send_hour"]],
-        "open_rate": [_fmt(v * 100, 1) for v in df["open_rate"]],
-        "click_rate": [_fmt(v * 100, 1) for v in df["click_rate"]],
+        "labels": [f"{h:02d}:00" for h in tbl["send_hour"].to_pylist()],
+        "open_rate": _fmt_col(tbl["open_rate"], 1, scale=100),
+        "click_rate": _fmt_col(tbl["click_rate"], 1, scale=100),
     }
 
 
+@_memoize_on("contacts_by_lifecycle")
 def get_contacts_lifecycle() -> dict:
-    df = _load("contacts_by_lifecycle")
-    if df is None:
+    tbl = _load("contacts_by_lifecycle", columns=["lifecycle_stage", "count", "avg_lead_score"])
+    if tbl is None:
         return {"labels": [], "data": []}
-    stage_order = ["Subscriber", "Lead", "MQL", "SQL", "Opportunity", "Customer", "Evangelist"]
-    df["_order"] = df["lifecycle_stage"].map({s: i for i, s in enumerate(stage_order)})
-    df = df.sort_values("_order")
+    tbl = _sort_by_order(tbl, "lifecycle_stage", _LIFECYCLE_ORDER)
     return {
-        "labels": df["lifecycle_stage"].tolist(),
-        "count": [int(v) for v in df["count"]],
-        "avg_score": [_fmt(v, 1) for v in df["avg_lead_score"]],
+        "labels": tbl["lifecycle_stage"].to_pylist(),
+        "count": _int_col(tbl["count"]),
+        "avg_score": _fmt_col(tbl["avg_lead_score"], 1),
     }
 
 
+@_memoize_on("contacts_by_source")
 def get_contacts_by_source() -> dict:
-    df = _load("contacts_by_source")
-    if df is None:
+    tbl = _load("contacts_by_source", columns=["lead_source", "count", "avg_lead_score"])
+    if tbl is None:
         return {"labels": [], "data": []}
-    df = df.sort_values("count", ascending=False)
+    tbl = tbl.sort_by([("count", "descending")])
     return {
-        "labels": df["lead_source"].tolist(),
-        "count": [int(v) for v in df["count"]],
-        "avg_score": [_fmt(v, 1) for v in df["avg_lead_score"]],
+        "labels": tbl["lead_source"].to_pylist(),
+        "count": _int_col(tbl["count"]),
+        "avg_score": _fmt_col(tbl["avg_lead_score"], 1),
     }
 
 
+@_memoize_on("support_by_category")
 def get_support_by_category() -> dict:
-    df = _load("support_by_category")
-    if df is None:
+    tbl = _load("support_by_category", columns=[
+        "category", "ticket_count", "avg_resolution_hours", "sla_compliance", "avg_satisfaction",
+    ])
+    if tbl is None:
         return {"labels": [], "data": []}
-    df = df.sort_values("ticket_count", ascending=False)
+    tbl = tbl.sort_by([("ticket_count", "descending")])
     return {
-        "labels": df["category"].tolist(),
-        "ticket_count": [int(v) for v in df["ticket_count"]],
-        "avg_resolution": [_fmt(v, 1) for v in df["avg_resolution_hours"]],
-        "sla_compliance": [_fmt(v * 100, 1) for v in df["sla_compliance"]],
-        "satisfaction": [_fmt(v, 1) for v in df["avg_satisfaction"]],
+        "labels": tbl["category"].to_pylist(),
+        "ticket_count": _int_col(tbl["ticket_count"]),
+        "avg_resolution": _fmt_col(tbl["avg_resolution_hours"], 1),
+        "sla_compliance": _fmt_col(tbl["sla_compliance"], 1, scale=100),
+        "satisfaction": _fmt_col(tbl["avg_satisfaction"], 1),
     }
 
 
+@_memoize_on("support_by_priority")
 def get_support_by_priority() -> dict:
-    df = _load("support_by_priority")
-    if df is None:
+    tbl = _load("support_by_priority", columns=[
+        "priority", "ticket_count", "avg_resolution_hours", "sla_compliance",
+    ])
+    if tbl is None:
         return {"labels": [], "data": []}
-    order = ["Critical", "High", "Medium", "Low"]
-    df["_order"] = df["priority"].map({s: i for i, s in enumerate(order)})
-    df = df.sort_values("_order")
+    tbl = _sort_by_order(tbl, "priority", _PRIORITY_ORDER)
     return {
-        "labels": df["priority"].tolist(),
-        "ticket_count": [int(v) for v in df["ticket_count"]],
-        "avg_resolution": [_fmt(v, 1) for v in df["avg_resolution_hours"]],
-        "sla_compliance": [_fmt(v * 100, 1) for v in df["sla_compliance"]],
+        "labels": tbl["priority"].to_pylist(),
+        "ticket_count": _int_col(tbl["ticket_count"]),
+        "avg_resolution": _fmt_col(tbl["avg_resolution_hours"], 1),
+        "sla_compliance": _fmt_col(tbl["sla_compliance"], 1, scale=100),
     }
 
 
+@_memoize_on("web_by_page")
 def get_web_top_pages() -> dict:
-    df = _load("web_by_page")
-    if df is None:
+    tbl = _load("web_by_page", columns=["page_url", "sessions", "bounce_rate", "conversion_rate"])
+    if tbl is None:
         return {"labels": [], "data": []}
-    df = df.sort_values("sessions", ascending=False)
+    tbl = tbl.sort_by([("sessions", "descending")])
     return {
-        "labels": df["page_url"].tolist(),
-        "sessions": [int(v) for v in df["sessions"]],
-        "bounce_rate": [_fmt(v * 100, 1) for v in df["bounce_rate"]],
-        "conversion_rate": [_fmt(v * 100, 2) for v in df["conversion_rate"]],
+        "labels": tbl["page_url"].to_pylist(),
+        "sessions": _int_col(tbl["sessions"]),
+        "bounce_rate": _fmt_col(tbl["bounce_rate"], 1, scale=100),
+        "conversion_rate": _fmt_col(tbl["conversion_rate"], 2, scale=100),
     }
 
 
+@_memoize_on("web_by_country")
 def get_web_by_country() -> dict:
-    df = _load("web_by_country")
-    if df is None:
+    tbl = _load("web_by_country", columns=["country", "sessions", "conversion_rate"])
+    if tbl is None:
         return {"labels": [], "data": []}
-    df = df.sort_values("sessions", ascending=False).head(15)
+    tbl = tbl.sort_by([("sessions", "descending")]).slice(0, 15)
     return {
-        "labels": df["country"].tolist(),
-        "sessions": [int(v) for v in df["sessions"]],
-        "conversion_rate": [_fmt(v * 100, 2) for v in df["conversion_rate"]],
+        "labels": tbl["country"].to_pylist(),
+        "sessions": _int_col(tbl["sessions"]),
+        "conversion_rate": _fmt_col(tbl["conversion_rate"], 2, scale=100),
     }
 
 
+@_memoize_on("web_by_device")
 def get_web_by_device() -> dict:
-    df = _load("web_by_device")
-    if df is None:
+    tbl = _load("web_by_device", columns=[
+        "device_type", "sessions", "bounce_rate", "conversion_rate",
+    ])
+    if tbl is None:
         return {"labels": [], "data": []}
     return {
-        "labels": df["device_type"].tolist(),
-        "sessions": [int(v) for v in df["sessions"]],
-        "bounce_rate": [_fmt(v * 100, 1) for v in df["bounce_rate"]],
-        "conversion_rate": [_fmt(v * 100, 2) for v in df["conversion_rate"]],
+        "labels": tbl["device_type"].to_pylist(),
+        "sessions": _int_col(tbl["sessions"]),
+        "bounce_rate": _fmt_col(tbl["bounce_rate"], 1, scale=100),
+        "conversion_rate": _fmt_col(tbl["conversion_rate"], 2, scale=100),
     }
 
 
+@_memoize_on("web_by_month")
 def get_web_trend() -> dict:
-    df = _load("web_by_month")
-    if df is None:
+    tbl = _load("web_by_month", columns=["month", "sessions", "conversion_rate"])
+    if tbl is None:
         return {"labels": [], "datasets": []}
-    df = df.sort_values("month")
+    tbl = tbl.sort_by("month")
     return {
-        "labels": df["month"].tolist(),
+        "labels": tbl["month"].to_pylist(),
         "datasets": [
-            {"label": "Sessions", "data": [int(v) for v in df["sessions"]]},
-            {"label": "Conversion %", "data": [_fmt(v * 100, 2) for v in df["conversion_rate"]]},
+            {"label": "Sessions", "data": _int_col(tbl["sessions"])},
+            {"label": "Conversion %", "data": _fmt_col(tbl["conversion_rate"], 2, scale=100)},
         ]
     }
 
 
+@_memoize_on("companies_by_industry")
 def get_companies_by_industry() -> dict:
-    df = _load("companies_by_industry")
-    if df is None:
+    tbl = _load("companies_by_industry", columns=["industry", "company_count", "avg_revenue"])
+    if tbl is None:
         return {"labels": [], "data": []}
-    df = df.sort_values("company_count", ascending=False)
+    tbl = tbl.sort_by([("company_count", "descending")])
     return {
-        "labels": df["industry"].tolist(),
-        "count": [int(v) for v in df["company_count"]],
-        "avg_revenue": [_fmt(v) for v in df["avg_revenue"]],
+        "labels": tbl["industry"].to_pylist(),
+        "count": _int_col(tbl["company_count"]),
+        "avg_revenue": _fmt_col(tbl["avg_revenue"]),
     }
 
 
+@_memoize_on("companies_by_region")
 def get_companies_by_region() -> dict:
-    df = _load("companies_by_region")
-    if df is None:
+    tbl = _load("companies_by_region", columns=["region", "company_count", "avg_revenue"])
+    if tbl is None:
         return {"labels": [], "data": []}
     return {
-        "labels": df["region"].tolist(),
-        "count": [int(v) for v in df["company_count"]],
-        "avg_revenue": [_fmt(v) for v in df["avg_revenue"]],
+        "labels": tbl["region"].to_pylist(),
+        "count": _int_col(tbl["company_count"]),
+        "avg_revenue": _fmt_col(tbl["avg_revenue"]),
     }
 
 
 # ── Full dashboard payload ─────────────────────────────────────────
 
+# (data_version, payload) of the last full build.
+_payload_cache: tuple[float, dict] | None = None
+
+
+def clear_cache():
+    """Drop memoized frames and payloads so the next call rereads disk."""
+    global _payload_cache
+    _payload_cache = None
+    _read_table.cache_clear()
+    for provider in _memoized_providers:
+        provider.cache_clear()
+
+
+# Payload key -> provider. Each provider reads its own Parquet file(s), and
+# pyarrow releases the GIL while decoding, so they are built concurrently.
+_DASHBOARD_PANELS = {
+    "kpis": get_kpi_summary,
+    "revenue_trend": get_revenue_trend,
+    "deals_by_stage": get_deals_by_stage,
+    "deals_by_region": get_deals_by_region,
+    "deals_by_industry": get_deals_by_industry,
+    "deals_by_pipeline": get_deals_by_pipeline,
+    "marketing_channels": get_marketing_channels,
+    "marketing_trend": get_marketing_trend,
+    "marketing_event_types": get_marketing_event_types,
+    "email_performance": get_email_performance,
+    "email_trend": get_email_trend,
+    "email_by_hour": get_email_by_hour,
+    "contacts_lifecycle": get_contacts_lifecycle,
+    "contacts_by_source": get_contacts_by_source,
+    "support_by_category": get_support_by_category,
+    "support_by_priority": get_support_by_priority,
+    "web_top_pages": get_web_top_pages,
+    "web_by_country": get_web_by_country,
+    "web_by_device": get_web_by_device,
+    "web_trend": get_web_trend,
+    "companies_by_industry": get_companies_by_industry,
+    "companies_by_region": get_companies_by_region,
+}
+
+
+def iter_dashboard_panels():
+    """Yield ``(key, panel)`` pairs in completion order as providers finish."""
+    with ThreadPoolExecutor(max_workers=NUM_PARTITIONS) as executor:
+        futures = {executor.submit(provider): key for key, provider in _DASHBOARD_PANELS.items()}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
 def get_full_dashboard_data() -> dict:
-    return {
-        "kpis": get_kpi_summary(),
-        "revenue_trend": get_revenue_trend(),
-        "deals_by_stage": get_deals_by_stage(),
-        "deals_by_region": get_deals_by_region(),
-        "deals_by_industry": get_deals_by_industry(),
-        "deals_by_pipeline": get_deals_by_pipeline(),
-        "marketing_channels": get_marketing_channels(),
-        "marketing_trend": get_marketing_trend(),
-        "marketing_event_types": get_marketing_event_types(),
-        "email_performance": get_email_performance(),
-        "email_trend": get_email_trend(),
-        "email_by_hour": get_email_by_hour(),
-        "contacts_lifecycle": get_contacts_lifecycle(),
-        "contacts_by_source": get_contacts_by_source(),
-        "support_by_category": get_support_by_category(),
-        "support_by_priority": get_support_by_priority(),
-        "web_top_pages": get_web_top_pages(),
-        "web_by_country": get_web_by_country(),
-        "web_by_device": get_web_by_device(),
-        "web_trend": get_web_trend(),
-        "companies_by_industry": get_companies_by_industry(),
-        "companies_by_region": get_companies_by_region(),
-    }
+    global _payload_cache
+    version = get_data_version()
+    if _payload_cache is not None and _payload_cache[0] == version:
+        return _payload_cache[1]
+    panels = dict(iter_dashboard_panels())
+    payload = {key: panels[key] for key in _DASHBOARD_PANELS}
+    _payload_cache = (version, payload)
+    return payload
+
+
+# ── Precomputed payload ────────────────────────────────────────────
+
+def _payload_path() -> str:
+    return os.path.join(AGGREGATED_DIR, "dashboard_payload.json")
+
+
+def dump_dashboard_payload() -> str:
+    """Serialize the full dashboard payload next to the aggregates.
+
+    Called at the end of the ETL so the dashboard can serve the bytes as-is.
+    """
+    path = _payload_path()
+    body = orjson.dumps(get_full_dashboard_data(), option=orjson.OPT_SERIALIZE_NUMPY)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(body)
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_dashboard_payload() -> bytes | None:
+    """Bytes written by ``dump_dashboard_payload``, or None if missing or
+    older than the Parquet files it was built from."""
+    path = _payload_path()
+    try:
+        if os.stat(path).st_mtime < get_data_version():
+            return None
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
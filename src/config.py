@@ -11,6 +11,7 @@ NUM_MARKETING_EVENTS = 1_000_000
 NUM_SUPPORT_TICKETS = 200_000
 NUM_EMAIL_CAMPAIGNS = 800_000
 NUM_WEB_ANALYTICS = 2_000_000
+ROW_GROUP_SIZE = 256_000
 
 # ─── Paths ─────────────────────────────────────────────────────────
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -29,6 +30,8 @@ DATE_RANGE_END = "2025-12-31"
 DASHBOARD_HOST = "0.0.0.0"
 DASHBOARD_PORT = int(os.environ.get("PORT", 5000))
 DEBUG = os.environ.get("FLASK_DEBUG", "0") == "1"
+DASHBOARD_WORKERS = int(os.environ.get("WEB_CONCURRENCY", 4))
+DASHBOARD_THREADS = int(os.environ.get("DASHBOARD_THREADS", 8))
 
 # ─── Industry & Region Mappings ────────────────────────────────────
 INDUSTRIES = [
@@ -49,6 +52,8 @@ DEAL_STAGES = [
     "Closed Won", "Closed Lost"
 ]
 
+LIFECYCLE_STAGES = ["Subscriber", "Lead", "MQL", "SQL", "Opportunity", "Customer", "Evangelist"]
+
 LEAD_SOURCES = [
     "Organic Search", "Paid Search", "Social Media", "Email Marketing",
     "Direct Traffic", "Referral", "Content Marketing", "Events",
@@ -1,25 +1,204 @@
 """Tests for the analytics API layer."""
+import gzip
 import os
 import sys
 import json
+import numpy as np
+import pandas as pd
+import pyarrow as pa
 import pytest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from src.analytics import _fmt
+import src.analytics as analytics
+from dashboard.app import app, _response_cache
+from src.analytics import (
+    _DASHBOARD_PANELS, _fmt_col, _fmt_float, _int_col, _load, _memoize_on, _sort_by_order,
+)
+from src.data_pipeline import AGGREGATIONS, PROCESSORS
+from tests.test_pipeline import (
+    make_companies, make_contacts, make_deals, make_marketing,
+    make_emails, make_tickets, make_web,
+)
+
+_FACTORIES = {
+    "companies": make_companies,
+    "contacts": make_contacts,
+    "deals": make_deals,
+    "marketing_events": make_marketing,
+    "email_campaigns": make_emails,
+    "support_tickets": make_tickets,
+    "web_analytics": make_web,
+}
+
+
+@pytest.fixture
+def dataset(tmp_path, monkeypatch):
+    """Small processed + aggregated dataset under tmp_path, wired into the
+    analytics layer in place of data/processed and data/aggregated."""
+    processed_dir, aggregated_dir = tmp_path / "processed", tmp_path / "aggregated"
+    processed_dir.mkdir()
+    aggregated_dir.mkdir()
+    frames = {}
+    for name, factory in _FACTORIES.items():
+        frames[name] = PROCESSORS[name](factory())
+        frames[name].to_parquet(processed_dir / f"{name}.parquet", index=False)
+    for agg_name, (agg_fn, source) in AGGREGATIONS.items():
+        agg_fn(frames[source]).to_parquet(aggregated_dir / f"{agg_name}.parquet", index=False)
+    monkeypatch.setattr(analytics, "PROCESSED_DIR", str(processed_dir))
+    monkeypatch.setattr(analytics, "AGGREGATED_DIR", str(aggregated_dir))
+    analytics.clear_cache()
+    yield frames
+    analytics.clear_cache()
 
 
 class TestFormatting:
     def test_fmt_float(self):
-        assert _fmt(3.14159, 2) == 3.14
+        assert _fmt_float(3.14159, 2) == 3.14
+
+    def test_fmt_float_fast_path(self):
+        assert _fmt_float(np.float64(2.345), 1) == 2.3
+        assert type(_fmt_float(7)) is float
+
+    def test_fmt_col_scales_and_rounds(self):
+        col = pa.chunked_array([[0.12345, 0.5, 0.98765]])
+        assert _fmt_col(col, 1, scale=100) == [12.3, 50.0, 98.8]
+        assert all(type(v) is float for v in _fmt_col(col))
+
+    def test_int_col_native_ints(self):
+        out = _int_col(pa.chunked_array([[1, 2, 3]], type=pa.int32()))
+        assert out == [1, 2, 3] and all(type(v) is int for v in out)
+
+
+class TestDashboardApi:
+    @pytest.fixture
+    def client(self, dataset):
+        _response_cache.clear()
+        yield app.test_client()
+        _response_cache.clear()
+
+    def test_json_response_has_etag(self, client):
+        resp = client.get("/api/kpis")
+        assert resp.status_code == 200
+        assert resp.mimetype == "application/json"
+        assert resp.headers.get("ETag")
+        assert json.loads(resp.data)["total_deals"] == len(make_deals())
+
+    def test_matching_etag_returns_304(self, client):
+        etag = client.get("/api/kpis").headers["ETag"]
+        resp = client.get("/api/kpis", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+
+    def test_responses_revalidate(self, client):
+        resp = client.get("/api/kpis")
+        assert resp.cache_control.no_cache
+        assert "Accept-Encoding" in resp.vary
+
+    def test_rewritten_data_refreshes_response(self, client, dataset, tmp_path):
+        assert json.loads(client.get("/api/kpis").data)["total_deals"] == len(dataset["deals"])
+        path = tmp_path / "processed" / "deals.parquet"
+        dataset["deals"].head(10).to_parquet(path, index=False)
+        os.utime(path, (path.stat().st_atime, path.stat().st_mtime + 10))
+        assert json.loads(client.get("/api/kpis").data)["total_deals"] == 10
+
+    def test_dashboard_stream_is_ndjson(self, client):
+        resp = client.get("/api/dashboard/stream")
+        assert resp.mimetype == "application/x-ndjson"
+        lines = [json.loads(line) for line in resp.data.splitlines()]
+        assert all(len(line) == 1 for line in lines)
+        assert {key for line in lines for key in line} == set(_DASHBOARD_PANELS)
+
+    def test_gzip_when_accepted(self, client):
+        resp = client.get("/api/dashboard", headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert "kpis" in json.loads(gzip.decompress(resp.data))
+
+    def test_identity_when_gzip_refused(self, client):
+        resp = client.get("/api/dashboard", headers={"Accept-Encoding": "gzip;q=0"})
+        assert "Content-Encoding" not in resp.headers
+        assert "kpis" in json.loads(resp.data)
+
+
+class TestLoadCache:
+    def test_load_memoized_until_file_changes(self, tmp_path):
+        path = tmp_path / "t.parquet"
+        pd.DataFrame({"a": [1, 2]}).to_parquet(path)
+        first = _load("t", str(tmp_path))
+        assert _load("t", str(tmp_path)) is first
+
+        pd.DataFrame({"a": [1, 2, 3]}).to_parquet(path)
+        os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+        assert len(_load("t", str(tmp_path))) == 3
+
+    def test_sort_by_order_puts_unknown_last(self):
+        tbl = pa.table({"priority": ["Low", "Other", "Critical", "High"]})
+        order = pa.array(["Critical", "High", "Medium", "Low"])
+        out = _sort_by_order(tbl, "priority", order)["priority"].to_pylist()
+        assert out == ["Critical", "High", "Low", "Other"]
+
+    def test_provider_memoized_until_source_changes(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(analytics, "AGGREGATED_DIR", str(tmp_path))
+        path = tmp_path / "t.parquet"
+        pd.DataFrame({"a": [1]}).to_parquet(path)
+        calls = []
+
+        @_memoize_on("t")
+        def provider():
+            calls.append(1)
+            return {"calls": len(calls)}
+
+        first = provider()
+        assert provider() is first and len(calls) == 1
+
+        os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+        assert provider() == {"calls": 2}
+
+        provider.cache_clear()
+        assert provider() == {"calls": 3}
+
+    def test_load_missing_returns_none(self, tmp_path):
+        assert _load("missing", str(tmp_path)) is None
+
+
+class TestPrecomputedPayload:
+    def test_dump_then_read_roundtrip(self, dataset):
+        assert analytics.read_dashboard_payload() is None
+
+        analytics.dump_dashboard_payload()
+        payload = json.loads(analytics.read_dashboard_payload())
+        assert set(payload) == set(analytics._DASHBOARD_PANELS)
+        deals = dataset["deals"]
+        assert payload["kpis"]["total_deals"] == len(deals)
+        assert payload["kpis"]["total_revenue"] == round(deals["amount"].sum(), 2)
+        assert payload["deals_by_stage"]["labels"] == [
+            "Prospecting", "Qualification", "Closed Won", "Closed Lost",
+        ]
+        assert sum(payload["deals_by_stage"]["counts"]) == len(deals)
+        assert sorted(payload["web_by_country"]["labels"]) == ["DE", "UK", "US"]
+
+    def test_stale_payload_ignored(self, dataset):
+        path = analytics.dump_dashboard_payload()
+        os.utime(path, (0, 0))
+        assert analytics.read_dashboard_payload() is None
 
-    def test_fmt_int(self):
-        assert _fmt(42) == 42
 
-    def test_fmt_numpy(self):
-        import numpy as np
-        assert _fmt(np.float64(2.5), 1) == 2.5
-        assert _fmt(np.int64(100)) == 100
+class TestKpiSummary:
+    def test_zero_row_processed_tables(self, dataset, tmp_path):
+        for name, frame in dataset.items():
+            frame.iloc[:0].to_parquet(tmp_path / "processed" / f"{name}.parquet", index=False)
+        analytics.clear_cache()
+        kpis = analytics.get_kpi_summary()
+        assert kpis["total_tickets"] == 0 and kpis["sla_compliance"] == 0
+        assert kpis["total_sessions"] == 0 and kpis["conversion_rate"] == 0
+        assert kpis["email_open_rate"] == 0 and kpis["avg_deal_size"] == 0
+        analytics.dump_dashboard_payload()
 
-    def test_fmt_string_passthrough(self):
-        assert _fmt("hello") == "hello"
+    def test_deal_means_skip_nulls(self, dataset, tmp_path):
+        deals = dataset["deals"].head(4).copy()
+        deals["amount"] = [100.0, 300.0, None, None]
+        deals["is_won"] = pd.array([1, 0, None, 1], dtype="Int8")
+        deals.to_parquet(tmp_path / "processed" / "deals.parquet", index=False)
+        analytics.clear_cache()
+        kpis = analytics.get_kpi_summary()
+        assert kpis["avg_deal_size"] == 200.0
+        assert kpis["win_rate"] == round(2 / 3 * 100, 1)
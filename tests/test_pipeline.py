@@ -8,14 +8,17 @@ import pytest
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from src.data_pipeline import (
-    _revenue_bucket, _employee_tier, _lead_grade,
+    _revenue_bucket, _employee_tier, _lead_grade, _period_labels,
     process_companies, process_contacts, process_deals,
     process_marketing_events, process_email_campaigns,
     process_support_tickets, process_web_analytics,
     aggregate_revenue_by_quarter, aggregate_pipeline_stages,
     aggregate_marketing_by_channel, aggregate_email_performance,
     aggregate_support_by_category, aggregate_web_by_page,
+    _process_file,
 )
+import src.data_pipeline as data_pipeline
+from data.names import EMAIL_DOMAINS, company_names, contact_emails, deal_names
 
 
 # ── Helper factories ────────────────────────────────────────────────
@@ -155,6 +158,19 @@ class TestBucketing:
         assert result.iloc[0] == "F"
         assert result.iloc[-1] == "A"
 
+    def test_bucket_edges_match_pd_cut(self):
+        s = pd.Series([-1, 0, 1_000, 1_000.01, 1_000_000, np.nan])
+        bins = [0, 1_000, 10_000, 50_000, 200_000, 1_000_000, float("inf")]
+        labels = ["< $1K", "$1K–10K", "$10K–50K", "$50K–200K", "$200K–1M", "> $1M"]
+        expected = pd.cut(s, bins=bins, labels=labels)
+        pd.testing.assert_series_equal(_revenue_bucket(s), expected)
+
+    def test_period_labels_match_to_period(self):
+        ts = pd.Series(pd.to_datetime(["1969-12-31 00:00:00", "2023-01-01 00:00:00", "2024-11-30 23:59:00", None]))
+        for freq in ("M", "Q"):
+            expected = ts.dt.to_period(freq).astype(str)
+            pd.testing.assert_series_equal(_period_labels(ts, freq), expected)
+
 
 # ── Transformation tests ────────────────────────────────────────────
 
@@ -194,12 +210,22 @@ class TestTransformations:
         assert "is_clicked" in df.columns
         assert "is_bounced" in df.columns
         assert "is_unsub" in df.columns
+        clicked = df["action"] == "Clicked"
+        assert (df.loc[clicked, "is_opened"] == 1).all()
+        assert (df["is_bounced"] == (df["action"] == "Bounced")).all()
 
     def test_process_tickets(self):
         df = process_support_tickets(make_tickets())
         assert "sla_met" in df.columns
         assert "quarter" in df.columns
 
+    def test_sla_thresholds(self):
+        tickets = make_tickets(6)
+        tickets["priority"] = ["Critical", "Critical", "Low", "Low", "Unknown", None]
+        tickets["resolution_hours"] = [4.0, 4.5, 168.0, 200.0, 1.0, 1.0]
+        df = process_support_tickets(tickets)
+        assert df["sla_met"].tolist() == [1, 0, 1, 0, 0, 0]
+
     def test_process_web(self):
         df = process_web_analytics(make_web())
         assert "hour" in df.columns
@@ -265,6 +291,39 @@ class TestDataIntegrity:
         df = process_support_tickets(make_tickets())
         assert df["sla_met"].isin([0, 1]).all()
 
+    def test_streamed_processing_matches_whole_table(self, tmp_path, monkeypatch):
+        raw = make_deals()
+        raw.to_parquet(tmp_path / "raw.parquet", index=False)
+        monkeypatch.setattr(data_pipeline, "ROW_GROUP_SIZE", 64)
+        rows, partials = _process_file(
+            process_deals, str(tmp_path / "raw.parquet"), str(tmp_path / "out.parquet"),
+            {"revenue_by_quarter": aggregate_revenue_by_quarter},
+        )
+        assert rows == len(raw)
+        assert len(partials["revenue_by_quarter"]) == -(-len(raw) // 64)
+        result = pd.read_parquet(tmp_path / "out.parquet")
+        deals = process_deals(raw)
+        pd.testing.assert_frame_equal(result, deals)
+        pd.testing.assert_frame_equal(
+            aggregate_revenue_by_quarter.merge(partials["revenue_by_quarter"]).to_pandas(),
+            aggregate_revenue_by_quarter(deals),
+        )
+
+
+class TestNames:
+    def test_company_names(self):
+        assert list(company_names(np.array([1, 42, 123456]))) == [
+            "Company_000001", "Company_000042", "Company_123456"]
+
+    def test_deal_names(self):
+        assert list(deal_names(np.array([1, 1234567]))) == ["Deal_0000001", "Deal_1234567"]
+
+    def test_contact_emails_rotate_domains(self):
+        ids = np.arange(1, 22)
+        assert list(contact_emails(ids)) == [f"user_{i}@{EMAIL_DOMAINS[i % 10]}" for i in ids]
+        assert contact_emails(np.array([1]))[0] == "user_1@yahoo.com"
+        assert contact_emails(np.array([10]))[0] == "user_10@gmail.com"
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])